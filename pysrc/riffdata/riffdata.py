@@ -21,6 +21,7 @@ import pprint
 from datetime import timedelta
 
 # Third party imports
+import numpy as np
 from pymongo import MongoClient
 
 # Local application imports
@@ -111,48 +112,17 @@ class Riffdata:
                  - 'meetingLengthMin': float - calculated length of the meeting in minutes
                  - 'participants': list of participant ids (strs) who attended the meeting
         """
-        meetings = []
-        pipeline = [
-            {'$match': {'room': {'$exists': True}  # turns out there are some bogus meetings w/o a room, so exclude those
-                       }
-            },
-            {'$addFields': {'meetingLengthMin': {'$divide': [{'$subtract': ['$endTime', '$startTime']}, 60000]}
-                           }
-            },
-            {'$lookup': {'from': 'participantevents',
-                         'localField': '_id',
-                         'foreignField': 'meeting',
-                         'as': 'participantevents'
-                        }
-            },
-            {'$addFields': {'participants': {'$setUnion': {'$reduce': {'input': '$participantevents.participants',
-                                                                       'initialValue': [],
-                                                                       'in': {'$concatArrays':
-                                                                                ['$$value', '$$this']
-                                                                             }
-                                                                      }
-                                                          }
-                                            }
-                           }
-            },
-            {'$project': {'startTime': True,
-                          'endTime': True,
-                          'meetingLengthMin': True,
-                          'participants': True,
-                          'room': True,
-                          'title': True,
-                          'context': True,
-                         }
-            },
-        ]
+        return list(self.iter_meetings(pre_query, post_query))
 
-        if pre_query is not None:
-            # Add query as an initial match stage to the aggregate pipeline
-            pipeline[0:0] = [{'$match': pre_query}]
+    def iter_meetings(self, pre_query=None, post_query=None):
+        """
+        Iterate over the meetings from the riffdata mongodb meetings collection as
+        they are read from the database instead of reading them all into a list.
 
-        if post_query is not None:
-            # Add query as a final match stage to the aggregate pipeline
-            pipeline.append({'$match': post_query})
+        The pre_query, post_query and the meetings yielded are the same as those
+        of get_meetings.
+        """
+        pipeline = Riffdata._get_meetings_pipeline(pre_query, post_query)
 
         meetings_cursor = self.db.meetings.aggregate(pipeline, allowDiskUse=True)
         # meetings_cursor = db.meetings.find(pre_query)
@@ -161,8 +131,36 @@ class Riffdata:
             if 'title' not in meeting:
                 meeting['title'] = meeting['room']
 
-            meetings.append(meeting)
-        return meetings
+            yield meeting
+
+    def get_meeting_counts_by_participants(self, pre_query=None):
+        """
+        Get the number of meetings grouped by their number of participants from the
+        riffdata mongodb meetings collection. The grouping is done by the database so
+        the meetings themselves are not returned.
+
+        :param pre_query: A mongo query for the meetings collection that can use any
+                          of the fields in the meeting document. This query filters
+                          out meetings before the pipeline adds calculated fields
+        :type pre_query: dict
+
+        :return: A list of the meeting groups where a group is a dict with the
+                 following keys:
+                 - '_id': int - the number of participants of the meetings in the group
+                 - 'count': int - the number of meetings in the group
+                 - 'first_meeting': datetime - start time of the earliest meeting in the group
+                 - 'last_meeting': datetime - start time of the latest meeting in the group
+        """
+        pipeline = Riffdata._get_meetings_pipeline(pre_query)
+        pipeline.append({'$group': {'_id': {'$size': '$participants'},
+                                    'count': {'$sum': 1},
+                                    'first_meeting': {'$min': '$startTime'},
+                                    'last_meeting': {'$max': '$startTime'},
+                                   }
+                        })
+
+        groups_cursor = self.db.meetings.aggregate(pipeline, allowDiskUse=True)
+        return Riffdata.get_raw_documents(groups_cursor)
 
     def get_meeting(self, meeting_id):
         qry = {'_id': meeting_id}
@@ -237,6 +235,27 @@ class Riffdata:
 
         return meetings
 
+    def get_meetings_with_participant_utterance_arrays(self):
+        """
+        Return a dict indexed by meeting id to a dict indexed by participant id
+        of the utterances by that participant in that meeting.
+        Unlike get_meetings_with_participant_utterances the utterances are not a list
+        of dicts, instead they are a dict of arrays of the start, end and duration
+        of all the utterances by the participant in the meeting, ordered as retrieved.
+        The start and end times are in milliseconds since the epoch (UTC).
+        { <meeting_id>: {<participant_id>: {start: int64[], end: int64[], duration: int64[]}, ...}, ...}
+        """
+        utterance_fields = {'_id': False,
+                            'meeting': True,
+                            'participant': True,
+                            'startTime': True,
+                            'endTime': True,
+                           }
+        utterance_cursor = self.db.utterances.find(projection=utterance_fields)
+        meetings = Riffdata._group_utterance_arrays(utterance_cursor)
+
+        return meetings
+
     def create_single_participant_db(self, participant_id, new_db_name):
         """
         Copy all data for the specified participant to a new database.
@@ -344,6 +363,57 @@ class Riffdata:
             docs.append(doc)
         return docs
 
+    @staticmethod
+    def _get_meetings_pipeline(pre_query=None, post_query=None):
+        """
+        Get the aggregate pipeline for the meetings collection which adds the
+        calculated meeting fields (see get_meetings) optionally filtered by the
+        given pre and post queries.
+        """
+        pipeline = [
+            {'$match': {'room': {'$exists': True}  # turns out there are some bogus meetings w/o a room, so exclude those
+                       }
+            },
+            {'$addFields': {'meetingLengthMin': {'$divide': [{'$subtract': ['$endTime', '$startTime']}, 60000]}
+                           }
+            },
+            {'$lookup': {'from': 'participantevents',
+                         'localField': '_id',
+                         'foreignField': 'meeting',
+                         'as': 'participantevents'
+                        }
+            },
+            {'$addFields': {'participants': {'$setUnion': {'$reduce': {'input': '$participantevents.participants',
+                                                                       'initialValue': [],
+                                                                       'in': {'$concatArrays':
+                                                                                ['$$value', '$$this']
+                                                                             }
+                                                                      }
+                                                          }
+                                            }
+                           }
+            },
+            {'$project': {'startTime': True,
+                          'endTime': True,
+                          'meetingLengthMin': True,
+                          'participants': True,
+                          'room': True,
+                          'title': True,
+                          'context': True,
+                         }
+            },
+        ]
+
+        if pre_query is not None:
+            # Add query as an initial match stage to the aggregate pipeline
+            pipeline[0:0] = [{'$match': pre_query}]
+
+        if post_query is not None:
+            # Add query as a final match stage to the aggregate pipeline
+            pipeline.append({'$match': post_query})
+
+        return pipeline
+
     @staticmethod
     def _group_utterances(utterance_cursor):
         """
@@ -375,6 +445,35 @@ class Riffdata:
 
         return meetings
 
+    @staticmethod
+    def _group_utterance_arrays(utterance_cursor):
+        """
+        Group the start and end times of all the utterances from the cursor by meeting id
+        and then by participant id, and convert them to arrays of the start, end and
+        duration of the participant's utterances.
+        """
+        meetings = {}
+        for u in utterance_cursor:
+            # see _group_utterances, skip the utterances w/o a meeting field
+            if 'meeting' not in u:
+                continue
+
+            participant_uts = meetings.setdefault(u['meeting'], {})
+            starts, ends = participant_uts.setdefault(u['participant'], ([], []))
+            starts.append(u['startTime'])
+            ends.append(u['endTime'])
+
+        for participant_uts in meetings.values():
+            for participant_id, (starts, ends) in participant_uts.items():
+                start = np.array(starts, dtype='datetime64[ms]').astype(np.int64)
+                end = np.array(ends, dtype='datetime64[ms]').astype(np.int64)
+                participant_uts[participant_id] = {'start': start,
+                                                   'end': end,
+                                                   'duration': end - start,
+                                                  }
+
+        return meetings
+
     @staticmethod
     def print_meeting(meeting):
         """
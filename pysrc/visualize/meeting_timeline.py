@@ -19,6 +19,7 @@ Copyright       (c) 2019 Michael Jay Lippert,
 
 # Standard library imports
 from datetime import datetime, timedelta
+from operator import itemgetter
 import pprint
 
 # Third party imports
@@ -82,7 +83,7 @@ def process_utterances(meeting):
 
 
 def join_utterances(uts, min_gap):
-    uts.sort(key=lambda ut: ut['start'])
+    uts.sort(key=itemgetter('start'))
     processed_uts = []
     cur_ut = uts[0]
     for ut in uts[1:]:
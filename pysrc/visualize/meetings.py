@@ -17,8 +17,8 @@ Copyright       (c) 2019-present Michael Jay Lippert,
 
 # Standard library imports
 import sys
-from functools import reduce
-from datetime import datetime, timedelta
+from collections import Counter, defaultdict
+from datetime import datetime
 from typing import (Any,
                     Iterable,
                     Mapping,
@@ -27,18 +27,20 @@ from typing import (Any,
                     Sequence,
                     Set,
                     Tuple,
-                    TypeVar,
                     Union,
                    )
-from numbers import Real
 from enum import Enum
 
+# Third party imports
+import numpy as np
+
 # Local application imports
 from riffdata.riffdata import Riffdata
 
 
-# Generic type variable for defining function parameters
-T = TypeVar('T')
+# The max meeting length in minutes of each bucket used to count meetings by length
+# No meetings are expected to fall outside of the final 12 hour bucket
+MEETING_LENGTH_BUCKETS = (5, 10, 20, 40, 60, 120, 180, 720)
 
 
 class RoomDetailLevel(Enum):
@@ -53,53 +55,18 @@ class RoomDetailLevel(Enum):
     ALL_MEETINGS = 'all-meetings'
 
 
-def inc_cnt(d: MutableMapping[T, int], key: T) -> MutableMapping[T, int]:
-    """
-    reduce predicate that increments d[key], creating that key and
-    setting it to 1 if it doesn't exist.
-
-    Use it to count keys for example:
-      # count the number of meetings with a particular count of participants from the list of meetings
-      counts = reduce(inc_cnt, [len(meeting['participants']) for meeting in meetings], {})
-    """
-    if key in d:
-        d[key] += 1
-    else:
-        d[key] = 1
-    return d
-
-
-def inc_bucket(buckets: Iterable[MutableSequence[Real]], v: Real) -> Iterable[MutableSequence[Real]]:
-    """
-    Given a sorted list of bucket counts where a bucket's 1st element is the
-    bucket max value and the 2nd element is the count for that bucket
-    Iterate the buckets to find the bucket where the given value v is less
-    than the bucket max value, and increment that bucket count.
-
-    Intended for use as a reduce predicate where the initial set of buckets
-    have a count of 0.
-
-    TODO: Allow a bucket w/ a max value of None which is always incremented
-          when reached. Intended to be the final bucket to count values that
-          didn't fall into any previous buckets (unless there is a better way
-          to do this).
-    """
-    for b in buckets:
-        if v < b[0]:
-            b[1] += 1
-            break
-    return buckets
-
-
 def write_buckets(buckets: Iterable[Sequence[Any]], *, f=sys.stdout) -> None:
+    lines: MutableSequence[str] = []
     prev_b: Union[Sequence[Any], None] = None
     for b in buckets:
         if prev_b is None:
-            f.write(f'  {"":4} < {b[0]:4}: {b[1]:4}\n')
+            lines.append(f'  {"":4} < {b[0]:4}: {b[1]:4}\n')
         else:
-            f.write(f'  {prev_b[0]:4} - {b[0]:4}: {b[1]:4}\n')
+            lines.append(f'  {prev_b[0]:4} - {b[0]:4}: {b[1]:4}\n')
         prev_b = b
 
+    f.write(''.join(lines))
+
 
 def contains_any(s: str, chars: str) -> bool:
     """
@@ -161,68 +128,83 @@ class MeetingsData:
         self.meetings = []
         self.meetings_by_room = {}
 
-        db_meetings = self._get_db_meetings(riffdata)
+        # The database groups the meetings by number of participants, so only the
+        # meetings w/ more than 1 participant need to be retrieved
+        participant_groups = self._get_db_meeting_counts_by_participants(riffdata)
 
-        if len(db_meetings) == 0:
+        if len(participant_groups) == 0:
             # There were no meetings
             return
 
-        self.meeting_stats['total_meetings'] = len(db_meetings)
-        self.meeting_stats['first_meeting'] = min(db_meetings, key=lambda m: m['startTime'])['startTime']
-        self.meeting_stats['last_meeting'] = max(db_meetings, key=lambda m: m['startTime'])['startTime']
-
-        init_partcnt_cnt: MutableMapping[int, int] = {}  # this exists solely to define the type for reduce below
-        self.meeting_stats['count_by_participants'] = reduce(inc_cnt,
-                                                             [len(meeting['participants'])
-                                                              for meeting in db_meetings],
-                                                             init_partcnt_cnt)
-
-        # filter the db_meetings list to exclude meetings w/ only 1 participant
-        db_meetings = [meeting for meeting in db_meetings if len(meeting['participants']) > 1]
-
-        if len(db_meetings) == 0:
-            # There were no meetings with more than 1 participant
-            return
-
-        self.meeting_stats['real_meetings'] = len(db_meetings)
+        self.meeting_stats['total_meetings'] = sum(group['count'] for group in participant_groups)
+        self.meeting_stats['first_meeting'] = min(group['first_meeting'] for group in participant_groups)
+        self.meeting_stats['last_meeting'] = max(group['last_meeting'] for group in participant_groups)
+        self.meeting_stats['count_by_participants'] = {group['_id']: group['count']
+                                                       for group in participant_groups}
 
         self.meetings = [{'_id':              meeting['_id'],
                           'room_name':        meeting['room'],
                           'title':            meeting['title'],
                           'context':          meeting.get('context', 'No Context'),
                           'meeting_start_ts': meeting['startTime'],
+                          'meeting_end_ts':   meeting['endTime'],
                           'meeting_length':   meeting['meetingLengthMin'],
-                          'participants':     meeting['participants'].copy(),
-                         } for meeting in db_meetings]
+                          'participants':     meeting['participants'],
+                          'num_participants': len(meeting['participants']),
+                         } for meeting in self._get_db_meetings(riffdata)]
+
+        if len(self.meetings) == 0:
+            # There were no meetings with more than 1 participant
+            return
+
+        self.meeting_stats['real_meetings'] = len(self.meetings)
 
         self.meetings_by_room = MeetingsData.get_meetings_by_room(self.meetings)
         self.rooms = self._get_all_room_summaries()
 
-        meeting_durations = [meeting['meeting_length'] for meeting in self.meetings]
-        self.meeting_stats['count_by_meeting_length'] = \
-            MeetingsData.get_count_by_meeting_length(meeting_durations)
-        self.meeting_stats['avg_meeting_length'] = sum(meeting_durations) / len(meeting_durations)
-        self.meeting_stats['num_reused_rooms'] = reduce(lambda total, cnt: total + 1 if cnt > 1 else total,
-                                                        [r['num_meetings'] for r in self.rooms], 0)
+        meeting_durations = np.fromiter((meeting['meeting_length'] for meeting in self.meetings),
+                                        dtype=np.float64, count=len(self.meetings))
 
         # find the set of unique participants in these meetings
-        all_meeting_participants: Set[str] = set().union(*[meeting['participants']
-                                                           for meeting in self.meetings])
+        all_meeting_participants: Set[str] = set()
+        for meeting in self.meetings:
+            all_meeting_participants.update(meeting['participants'])
+
+        self.meeting_stats['count_by_meeting_length'] = \
+            MeetingsData.get_count_by_meeting_length(meeting_durations)
+        self.meeting_stats['avg_meeting_length'] = float(meeting_durations.mean())
+        self.meeting_stats['num_reused_rooms'] = sum(1 for room in self.rooms if room['num_meetings'] > 1)
         self.meeting_stats['total_num_participants'] = len(all_meeting_participants)
 
-        longest_meeting = max(self.meetings, key=lambda m: m['meeting_length'])
+        longest_meeting = self.meetings[int(meeting_durations.argmax())]
         self.meeting_stats['longest_meeting'] = {'_id':              longest_meeting['_id'],
                                                  'room':             longest_meeting['room_name'],
                                                  'title':            longest_meeting['title'],
                                                  'context':          longest_meeting['context'],
                                                  'start':            longest_meeting['meeting_start_ts'],
+                                                 'end':              longest_meeting['meeting_end_ts'],
                                                  'length':           longest_meeting['meeting_length'],
-                                                 'num_participants': len(longest_meeting['participants']),
+                                                 'num_participants': longest_meeting['num_participants'],
                                                 }
 
     def _get_db_meetings(self, riffdata):
         """
-        Get the meetings in the request period from the RiffData
+        Get an iterator over the meetings w/ more than 1 participant in the request period
+        from the RiffData
+        """
+        post_qry = {'participants.1': {'$exists': True}}  # More than 1 participant
+        return riffdata.iter_meetings(self._get_request_period_query(), post_qry)
+
+    def _get_db_meeting_counts_by_participants(self, riffdata):
+        """
+        Get the counts of all the meetings in the request period grouped by number of
+        participants from the RiffData
+        """
+        return riffdata.get_meeting_counts_by_participants(self._get_request_period_query())
+
+    def _get_request_period_query(self):
+        """
+        Get the query for the meetings in the request period
         """
         # constraints for the query to implement the date range
         startTimeConstraints = {}
@@ -236,7 +218,7 @@ class MeetingsData:
         if len(startTimeConstraints) > 0:
             qry['startTime'] = startTimeConstraints
 
-        return riffdata.get_meetings(qry)
+        return qry
 
     def _get_all_room_summaries(self) -> Sequence[MutableMapping[str, Any]]:
         """
@@ -244,49 +226,66 @@ class MeetingsData:
         sorted by room name
         """
         all_room_details: Sequence[MutableMapping[str, Any]] = []
-        for room_name, room_meetings in self.meetings_by_room.items():
-            meeting_start_times = [meeting['meeting_start_ts'] for meeting in room_meetings]
-            meeting_minutes = [meeting['meeting_length'] for meeting in room_meetings]
-            participant_counts = [len(meeting['participants']) for meeting in room_meetings]
-            init_part_cnt: MutableMapping[str, int] = {}  # this exists solely to define the type for reduce below
+
+        # summarize the rooms in room name order so the room details are created sorted
+        for room_name in sorted(self.meetings_by_room):
+            room_meetings = self.meetings_by_room[room_name]
+
+            # summarize the room's meetings in a single pass
+            room_meeting = room_meetings[0]
+            first_meeting = last_meeting = room_meeting['meeting_start_ts']
+            min_length = max_length = room_meeting['meeting_length']
+            min_participants = max_participants = room_meeting['num_participants']
+            total_length = 0
+            room_participants = Counter()
+            for meeting in room_meetings:
+                start_ts = meeting['meeting_start_ts']
+                if start_ts < first_meeting:
+                    first_meeting = start_ts
+                elif start_ts > last_meeting:
+                    last_meeting = start_ts
+
+                meeting_length = meeting['meeting_length']
+                if meeting_length < min_length:
+                    min_length = meeting_length
+                elif meeting_length > max_length:
+                    max_length = meeting_length
+                total_length += meeting_length
+
+                num_participants = meeting['num_participants']
+                if num_participants < min_participants:
+                    min_participants = num_participants
+                elif num_participants > max_participants:
+                    max_participants = num_participants
+                room_participants.update(meeting['participants'])
+
             room_details = {'room_name':        room_name,
                             'num_meetings':     len(room_meetings),
-                            'first_meeting':    min(meeting_start_times),
-                            'last_meeting':     max(meeting_start_times),
-                            'num_participants': (min(participant_counts), max(participant_counts)),
-                            'meeting_length':   (min(meeting_minutes), max(meeting_minutes)),
-                            'avg_length':       sum(meeting_minutes) / len(meeting_minutes),
-                            'participants':     reduce(inc_cnt,
-                                                       [p for meeting in room_meetings
-                                                        for p in meeting['participants']],
-                                                       init_part_cnt),
+                            'first_meeting':    first_meeting,
+                            'last_meeting':     last_meeting,
+                            'num_participants': (min_participants, max_participants),
+                            'meeting_length':   (min_length, max_length),
+                            'avg_length':       total_length / len(room_meetings),
+                            'participants':     room_participants,
                            }
             all_room_details.append(room_details)
 
-        # order the room details by room name
-        all_room_details.sort(key=lambda r: r['room_name'])
-
         return all_room_details
 
     @staticmethod
     def get_count_by_meeting_length(meeting_durations) -> Sequence[Sequence[int]]:
         """
-        Count the meeting durations that fall into buckets of predefined lengths
+        Count the meeting durations that fall into the MEETING_LENGTH_BUCKETS
         and return the list of those counts
+
+        A duration is counted in the first bucket whose max is greater than the
+        duration, durations beyond the last bucket are not counted.
         """
-        meeting_duration_distribution = [
-            [5, 0],
-            [10, 0],
-            [20, 0],
-            [40, 0],
-            [60, 0],
-            [120, 0],
-            [180, 0],
-            [720, 0],  # No meetings are expected to fall outside of this 12 hour bucket
-        ]
-
-        reduce(inc_bucket, meeting_durations, meeting_duration_distribution)
-        return meeting_duration_distribution
+        num_buckets = len(MEETING_LENGTH_BUCKETS)
+        bucket_ndxs = np.searchsorted(MEETING_LENGTH_BUCKETS, meeting_durations, side='right')
+        bucket_cnts = np.bincount(bucket_ndxs, minlength=num_buckets + 1)[:num_buckets]
+
+        return [[bucket_max, int(cnt)] for bucket_max, cnt in zip(MEETING_LENGTH_BUCKETS, bucket_cnts)]
 
     @staticmethod
     def get_meetings_by_room(meetings: Sequence[Mapping[str, Any]]
@@ -296,16 +295,12 @@ class MeetingsData:
         given meetings
         """
         # reorganize the meetings by room
-        # dict of room name to room dict containing summary values and list of meetings
-        meetings_by_room: MutableMapping[str, MutableMapping[str, Any]] = {}
+        # dict of room name to list of meetings in that room
+        meetings_by_room: MutableMapping[str, MutableSequence[Mapping[str, Any]]] = defaultdict(list)
         for meeting in meetings:
-            room_name = meeting['room_name']
-            if room_name in meetings_by_room:
-                meetings_by_room[room_name].append(meeting)
-            else:
-                meetings_by_room[room_name] = [meeting]
+            meetings_by_room[meeting['room_name']].append(meeting)
 
-        return meetings_by_room
+        return dict(meetings_by_room)
 
 
 def write_room_details(meeting_data: MeetingsData,
@@ -332,68 +327,61 @@ def write_room_details(meeting_data: MeetingsData,
         # write nothing
         return
 
+    # The room details are collected and written to f all at once
+    details: MutableSequence[str] = []
+    write = details.append
+
     # all detail levels except none show how many rooms were used by the meetings
     rooms = meeting_data.rooms
-    f.write(f'{len(rooms)} rooms used\n')
+    write(f'{len(rooms)} rooms used\n')
 
     if detail_level is RoomDetailLevel.COUNT:
         # write each room and a count of how many times it was used
-        f.write('Count of the number of times a meeting room was used:\n')
-        for room in rooms:
-            f.write('{room_name}: {num_meetings}\n'.format(**room))
-        return
-
-    if detail_level is RoomDetailLevel.ALL_MEETINGS:
-        def write_meeting(f, m):
-            end = m['meeting_start_ts'] + timedelta(minutes=m['meeting_length'])
-            f.write('meeting "{title}" ({_id}) in room {room_name} ({meeting_length:.1f} minutes)\n'
-                    '{meeting_start_ts:%Y %b %d %H:%M} — {end:%H:%M}\n'
-                    '{num_participants} participants:\n'
-                    .format(**m, end=end, num_participants=len(m['participants'])))
-
-            i = 0
-            for p_id in m['participants']:
-                i += 1
-                f.write(f'  {i:2}) {p_id}\n')
+        write('Count of the number of times a meeting room was used:\n')
+        details.extend(f"{room['room_name']}: {room['num_meetings']}\n" for room in rooms)
 
+    elif detail_level is RoomDetailLevel.ALL_MEETINGS:
         # write each room and a count of how many times it was used
         # along w/ the details of all meetings in that room
         for room in rooms:
-            f.write('{room_name}: {num_meetings}\n'.format(**room))
-            for meeting in meeting_data.meetings_by_room[room['room_name']]:
-                write_meeting(f, meeting)
-                f.write('\n')
-        return
-
-    if detail_level is RoomDetailLevel.SUMMARY or detail_level is RoomDetailLevel.SUMMARY_ATTENDEES:
+            write(f"{room['room_name']}: {room['num_meetings']}\n")
+            for m in meeting_data.meetings_by_room[room['room_name']]:
+                write('meeting "{title}" ({_id}) in room {room_name} ({meeting_length:.1f} minutes)\n'
+                      '{meeting_start_ts:%Y %b %d %H:%M} — {meeting_end_ts:%H:%M}\n'
+                      '{num_participants} participants:\n'
+                      .format(**m))
+                details.extend(f'  {i:2}) {p_id}\n' for i, p_id in enumerate(m['participants'], start=1))
+                write('\n')
+
+    elif detail_level is RoomDetailLevel.SUMMARY or detail_level is RoomDetailLevel.SUMMARY_ATTENDEES:
         # print summary information about the meetings in each room
+        write_attendees = detail_level is RoomDetailLevel.SUMMARY_ATTENDEES
         for room in rooms:
-            # shorter var names for summary info (I think we can do even better)
-            shortest_meeting = room['meeting_length'][0]
-            longest_meeting = room['meeting_length'][1]
+            # shorter var names for summary info
+            shortest_meeting, longest_meeting = room['meeting_length']
             avg_meeting = room['avg_length']
-            fewest_participants = room['num_participants'][0]
-            most_participants = room['num_participants'][1]
+            fewest_participants, most_participants = room['num_participants']
 
-            f.write('{room_name}: {num_meetings} meetings\n'.format(**room))
+            write(f"{room['room_name']}: {room['num_meetings']} meetings\n")
 
             if fewest_participants == most_participants:
-                f.write(f'\tattended by {fewest_participants} participants\n')
+                write(f'\tattended by {fewest_participants} participants\n')
             else:
-                f.write(f'\tattended by {fewest_participants} - {most_participants} participants\n')
+                write(f'\tattended by {fewest_participants} - {most_participants} participants\n')
 
             if shortest_meeting == longest_meeting:
-                f.write(f'\tlasting {shortest_meeting:.1f} minutes\n')
+                write(f'\tlasting {shortest_meeting:.1f} minutes\n')
             else:
-                f.write(f'\tlasting from {shortest_meeting:.1f} to {longest_meeting:.1f} minutes'
-                        f' (avg: {avg_meeting:.1f})\n')
+                write(f'\tlasting from {shortest_meeting:.1f} to {longest_meeting:.1f} minutes'
+                      f' (avg: {avg_meeting:.1f})\n')
+
+            if write_attendees:
+                write('\troom participants (# of meetings)\n')
+                details.extend(f'\t\t{p_id} ({cnt})\n' for p_id, cnt in room['participants'].items())
 
-            if detail_level is RoomDetailLevel.SUMMARY_ATTENDEES:
-                f.write('\troom participants (# of meetings)\n')
-                for p_id, cnt in room['participants'].items():
-                    f.write(f'\t\t{p_id} ({cnt})\n')
+            write('\n')
 
-            f.write('\n')
+    f.write(''.join(details))
 
 
 def write_yaml_meeting_report(meeting_data: MeetingsData, *, f=sys.stdout) -> None:
@@ -402,13 +390,16 @@ def write_yaml_meeting_report(meeting_data: MeetingsData, *, f=sys.stdout) -> No
     """
     # In order to control the exact yaml layout for maximum readability
     # just write the lines as desired instead of using a yaml processor
+    # The lines are collected and written to f all at once
+    report: MutableSequence[str] = []
+    write = report.append
 
     # Preamble
-    f.write('%YAML 1.2\n---\n')
+    write('%YAML 1.2\n---\n')
 
     # Site that generated the meeting data
-    f.write('{}: {}\n'.format('site', meeting_data.site))
-    f.write('\n')
+    write(f'site: {meeting_data.site}\n')
+    write('\n')
 
     # meeting data request period
     start = meeting_data.request_period['start']
@@ -417,88 +408,88 @@ def write_yaml_meeting_report(meeting_data: MeetingsData, *, f=sys.stdout) -> No
                   else '# from the beginning of time'
     end_value = f'{end:%Y-%m-%dT%H:%M:%SZ}' if end is not None \
                 else '# to the end of time'
-    f.write('request_period:\n')
-    f.write('  {:<6}: {}\n'.format('start', start_value))
-    f.write('  {:<6}: {}\n'.format('end', end_value))
-    f.write('\n')
+    write('request_period:\n')
+    write(f"  {'start':<6}: {start_value}\n")
+    write(f"  {'end':<6}: {end_value}\n")
+    write('\n')
 
     # meeting stats
     meeting_stats = meeting_data.meeting_stats
-    f.write('meeting_stats:\n')
+    write('meeting_stats:\n')
 
     # NO Meetings! - write truncated report!
     if meeting_stats['total_meetings'] == 0:
-        f.write('  {:<23}: {}\n'.format('total_meetings', meeting_stats['total_meetings']))
-        f.write('  {:<23}: {}\n'.format('real_meetings', meeting_stats['real_meetings']))
-        f.write('  {:<23}: {:.1f}\n'.format('avg_meeting_length', meeting_stats['avg_meeting_length']))
-        f.write('  {:<23}: {}\n'.format('total_num_participants', meeting_stats['total_num_participants']))
-        f.write('...\n')
+        write(f"  {'total_meetings':<23}: {meeting_stats['total_meetings']}\n")
+        write(f"  {'real_meetings':<23}: {meeting_stats['real_meetings']}\n")
+        write(f"  {'avg_meeting_length':<23}: {meeting_stats['avg_meeting_length']:.1f}\n")
+        write(f"  {'total_num_participants':<23}: {meeting_stats['total_num_participants']}\n")
+        write('...\n')
+        f.write(''.join(report))
         return
 
-    f.write('  {:<23}: {:%Y-%m-%dT%H:%M:%SZ}\n'.format('first_meeting', meeting_stats['first_meeting']))
-    f.write('  {:<23}: {:%Y-%m-%dT%H:%M:%SZ}\n'.format('last_meeting', meeting_stats['last_meeting']))
-    f.write('  {:<23}: {}\n'.format('total_meetings', meeting_stats['total_meetings']))
-    f.write('  {:<23}: {}\n'.format('real_meetings', meeting_stats['real_meetings']))
-    f.write('  {:<23}: {:.1f}\n'.format('avg_meeting_length', meeting_stats['avg_meeting_length']))
-    f.write('  {:<23}: {}\n'.format('total_num_participants', meeting_stats['total_num_participants']))
-    f.write('  {:<23}: {}\n'.format('num_reused_rooms', meeting_stats['num_reused_rooms']))
+    write(f"  {'first_meeting':<23}: {meeting_stats['first_meeting']:%Y-%m-%dT%H:%M:%SZ}\n")
+    write(f"  {'last_meeting':<23}: {meeting_stats['last_meeting']:%Y-%m-%dT%H:%M:%SZ}\n")
+    write(f"  {'total_meetings':<23}: {meeting_stats['total_meetings']}\n")
+    write(f"  {'real_meetings':<23}: {meeting_stats['real_meetings']}\n")
+    write(f"  {'avg_meeting_length':<23}: {meeting_stats['avg_meeting_length']:.1f}\n")
+    write(f"  {'total_num_participants':<23}: {meeting_stats['total_num_participants']}\n")
+    write(f"  {'num_reused_rooms':<23}: {meeting_stats['num_reused_rooms']}\n")
 
     longest_meeting = meeting_stats['longest_meeting']
-    f.write('  longest_meeting:\n')
-    f.write('    {:<19}: {}\n'.format('room', longest_meeting['room']))
-    f.write('    {:<19}: {}\n'.format('title', yaml_str(longest_meeting['title'])))
-    f.write('    {:<19}: {:%Y-%m-%dT%H:%M:%SZ}\n'.format('start', longest_meeting['start']))
-    f.write('    {:<19}: {:.1f}\n'.format('length', longest_meeting['length']))
-    f.write('    {:<19}: {}\n'.format('num_participants', longest_meeting['num_participants']))
+    write('  longest_meeting:\n')
+    write(f"    {'room':<19}: {longest_meeting['room']}\n")
+    write(f"    {'title':<19}: {yaml_str(longest_meeting['title'])}\n")
+    write(f"    {'start':<19}: {longest_meeting['start']:%Y-%m-%dT%H:%M:%SZ}\n")
+    write(f"    {'length':<19}: {longest_meeting['length']:.1f}\n")
+    write(f"    {'num_participants':<19}: {longest_meeting['num_participants']}\n")
 
     count_by_participants = meeting_stats['count_by_participants']
-    f.write('  count_by_participants:\n')
+    write('  count_by_participants:\n')
     for num_participants in sorted(count_by_participants):
-        f.write('    - [{}, {:3d}]\n'.format(num_participants, count_by_participants[num_participants]))
+        write(f"    - [{num_participants}, {count_by_participants[num_participants]:3d}]\n")
 
-    f.write('  count_by_meeting_length:  # bucket max length in minutes, count of meetings in bucket\n')
+    write('  count_by_meeting_length:  # bucket max length in minutes, count of meetings in bucket\n')
     for bucket_minutes, cnt in meeting_stats['count_by_meeting_length']:
-        f.write('    - [{:3d}, {:3d}]\n'.format(bucket_minutes, cnt))
+        write(f"    - [{bucket_minutes:3d}, {cnt:3d}]\n")
 
-    f.write('\n')
+    write('\n')
 
     # rooms
-    f.write(f'rooms: # {len(meeting_data.rooms)} rooms used\n')
+    write(f'rooms: # {len(meeting_data.rooms)} rooms used\n')
     for room in meeting_data.rooms:
-        f.write('  - {:<17}: {}\n'.format('room_name', room['room_name']))
-        f.write('    {:<17}: {}\n'.format('num_meetings', room['num_meetings']))
-        f.write('    {:<17}: {:%Y-%m-%dT%H:%M:%SZ}\n'
-                .format('first_meeting', room['first_meeting']))
-        f.write('    {:<17}: {:%Y-%m-%dT%H:%M:%SZ}\n'
-                .format('last_meeting', room['last_meeting']))
-        f.write('    {:<17}: [{}, {}]\n'
-                .format('num_participants', room['num_participants'][0], room['num_participants'][1]))
-        f.write('    {:<17}: [{:.1f}, {:.1f}]\n'
-                .format('meeting_length', room['meeting_length'][0], room['meeting_length'][1]))
-        f.write('    {:<17}: {:.1f}\n'.format('avg_length', room['avg_length']))
-
-        f.write('    participants:  # participant id, num meetings attended\n')
-        for p_id, cnt in room['participants'].items():
-            f.write('      - ["{}", {:2d}]\n'.format(p_id, cnt))
-
-    f.write('\n')
+        write(f"  - {'room_name':<17}: {room['room_name']}\n")
+        write(f"    {'num_meetings':<17}: {room['num_meetings']}\n")
+        write(f"    {'first_meeting':<17}: {room['first_meeting']:%Y-%m-%dT%H:%M:%SZ}\n")
+        write(f"    {'last_meeting':<17}: {room['last_meeting']:%Y-%m-%dT%H:%M:%SZ}\n")
+        min_participants, max_participants = room['num_participants']
+        min_length, max_length = room['meeting_length']
+        write(f"    {'num_participants':<17}: [{min_participants}, {max_participants}]\n")
+        write(f"    {'meeting_length':<17}: [{min_length:.1f}, {max_length:.1f}]\n")
+        write(f"    {'avg_length':<17}: {room['avg_length']:.1f}\n")
+
+        write('    participants:  # participant id, num meetings attended\n')
+        report.extend(f'      - ["{p_id}", {cnt:2d}]\n'
+                      for p_id, cnt in room['participants'].items())
+
+    write('\n')
 
     # meetings
-    f.write('meetings:  # does not include meetings w/ only 1 participant\n')
+    write('meetings:  # does not include meetings w/ only 1 participant\n')
     for meeting in meeting_data.meetings:
-        f.write('  - {:<17}: {}\n'.format('_id', meeting['_id']))
-        f.write('    {:<17}: {}\n'.format('room_name', meeting['room_name']))
-        f.write('    {:<17}: {}\n'.format('meeting_title', yaml_str(meeting['title'])))
-        f.write('    {:<17}: {}\n'.format('meeting_context', meeting['context']))
-        f.write('    {:<17}: {:%Y-%m-%dT%H:%M:%SZ}\n'.format('meeting_start_ts', meeting['meeting_start_ts']))
-        f.write('    {:<17}: {}\n'.format('meeting_length', meeting['meeting_length']))
+        write(f"  - {'_id':<17}: {meeting['_id']}\n")
+        write(f"    {'room_name':<17}: {meeting['room_name']}\n")
+        write(f"    {'meeting_title':<17}: {yaml_str(meeting['title'])}\n")
+        write(f"    {'meeting_context':<17}: {meeting['context']}\n")
+        write(f"    {'meeting_start_ts':<17}: {meeting['meeting_start_ts']:%Y-%m-%dT%H:%M:%SZ}\n")
+        write(f"    {'meeting_length':<17}: {meeting['meeting_length']}\n")
 
-        f.write('    participants:\n')
-        for p_id in meeting['participants']:
-            f.write('      - {}\n'.format(p_id))
+        write('    participants:\n')
+        report.extend(f"      - {p_id}\n" for p_id in meeting['participants'])
 
     # yaml document end marker
-    f.write('...\n')
+    write('...\n')
+
+    f.write(''.join(report))
 
 
 def write_human_meeting_report(meeting_data: MeetingsData,
@@ -548,8 +539,7 @@ def write_human_meeting_report(meeting_data: MeetingsData,
             'meeting "{title}" ({_id}) in room {room} ({length:.1f} minutes)\n'
             '{start:%Y %b %d %H:%M} — {end:%H:%M} with '
             '{num_participants} participants\n\n'
-            .format(**longest_meeting,
-                    end=longest_meeting['start'] + timedelta(minutes=longest_meeting['length'])))
+            .format(**longest_meeting))
 
     f.write(f'Average length of a meeting was {meeting_stats["avg_meeting_length"]:.1f} minutes\n\n')
 
@@ -19,7 +19,6 @@ Copyright       (c) 2019-present Riff Learning Inc.,
 from datetime import timedelta
 
 # Third party imports
-import matplotlib.pyplot as plt
 import numpy as np
 
 # Local application imports
@@ -28,17 +27,16 @@ from riffdata.riffdata import Riffdata
 
 def get_utterance_durations(meetings):
     """
-    Get a list of the duration of all utterances from all meetings
-    """
-    durations = []
+    Get an array of the duration of all utterances from all meetings
 
-    for meeting_id in meetings:
-        participant_uts = meetings[meeting_id]
-        for participant_id in participant_uts:
-            uts = participant_uts[participant_id]
-            durations += [ut['duration'] for ut in uts]
+    :param meetings: Meetings w/ the arrays of utterance start, end and duration
+                     grouped by participant
+    """
+    durations = [uts['duration'] for participant_uts in meetings.values() for uts in participant_uts.values()]
+    if len(durations) == 0:
+        return np.empty(0, dtype=np.int64)
 
-    return durations
+    return np.concatenate(durations)
 
 
 def my_plotter(ax, data1, data2, param_dict):
@@ -70,8 +68,8 @@ def my_plotter(ax, data1, data2, param_dict):
 
 def _make_xy_sets_to_plot(x_src, y_src, ranges):
     """
-    convert the x_src and y_src into lists of np.arrays so that
-    each range given can be plotted.
+    split the x_src and y_src np.arrays into lists of np.arrays (views of
+    the source arrays, not copies) so that each range given can be plotted.
     e.g. if ranges=[1, 10, 100, 1000]
         x[0] and y[0] will contain [1:10]
         x[1] and y[1] will contain [10:100]
@@ -83,8 +81,8 @@ def _make_xy_sets_to_plot(x_src, y_src, ranges):
     y = []
     start = ranges[0]
     for end in ranges[1:]:
-        x.append(np.array(x_src[start:end]))
-        y.append(np.array(y_src[start:end]))
+        x.append(x_src[start:end])
+        y.append(y_src[start:end])
         start = end
 
     return x, y
@@ -93,7 +91,8 @@ def _make_xy_sets_to_plot(x_src, y_src, ranges):
 def _print_participant_uts_info(meeting_id, participant_uts):
     print(f'For the meeting with id {meeting_id}:')
     for participant_id in participant_uts:
-        print(f'  participant id {participant_id} had {len(participant_uts[participant_id])} utterances')
+        num_uts = len(participant_uts[participant_id]['duration'])
+        print(f'  participant id {participant_id} had {num_uts} utterances')
 
 
 def _print_bucket_data(buckets, bucket_cnt):
@@ -105,9 +104,9 @@ def _print_bucket_data(buckets, bucket_cnt):
 
 def _distribute_durations(durations):
     """
-    :param durations: sorted list of utterance durations in ms
-    :type durations: list
-    :return: A tuple consisting of the a list of buckets in ms, a matching list
+    :param durations: utterance durations in ms (need not be sorted)
+    :type durations: list or np.ndarray
+    :return: A tuple consisting of the a list of buckets in ms, a matching array
              of the count of utterances in that bucket w/ a final element w/ the
              count of remaining unbucketed utterances, and a graph range list
              for partitioning the buckets into visually relevant plots
@@ -121,26 +120,20 @@ def _distribute_durations(durations):
 
     graph_ranges = [1, 33, 97, 107]
 
-    bucket_cnt = [0]
-    bucket_ndx = 0
-    for duration in durations:
-        if bucket_ndx >= len(buckets) or duration <= buckets[bucket_ndx]:
-            bucket_cnt[bucket_ndx] += 1
-            continue
-
-        bucket_ndx += 1
-        while bucket_ndx < len(buckets) and duration > buckets[bucket_ndx]:
-            bucket_cnt.append(0)
-            bucket_ndx += 1
-
-        bucket_cnt.append(1)
+    # a duration belongs in the 1st bucket which is >= the duration, durations
+    # greater than the last bucket are counted in the final element
+    bucket_ndxs = np.searchsorted(buckets, np.asarray(durations, dtype=np.int64), side='left')
+    bucket_cnt = np.bincount(bucket_ndxs, minlength=len(buckets) + 1)
 
     return buckets, bucket_cnt, graph_ranges
 
 
 def do_analysis():
+    # matplotlib is only needed to plot the results, so don't import it w/ this module
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
     riffdata = Riffdata()
-    meetings = riffdata.get_meetings_with_participant_utterances()
+    meetings = riffdata.get_meetings_with_participant_utterance_arrays()
 
     print(f'Found utterances from {len(meetings)} meetings')
     meeting_ids = list(meetings)
@@ -151,18 +144,23 @@ def do_analysis():
     durations = get_utterance_durations(meetings)
     print(f'Found {len(durations)} utterances')
 
-    durations.sort()
-    print(f'shortest utterance was {durations[0]}ms and longest was {durations[-1]}ms')
+    print(f'shortest utterance was {durations.min()}ms and longest was {durations.max()}ms')
 
     buckets, bucket_cnt, graph_ranges = _distribute_durations(durations)
     _print_bucket_data(buckets, bucket_cnt)
 
-    x, y = _make_xy_sets_to_plot(x_src=buckets, y_src=bucket_cnt, ranges=graph_ranges)
+    x, y = _make_xy_sets_to_plot(x_src=np.asarray(buckets), y_src=bucket_cnt, ranges=graph_ranges)
+
+    # plot all the ranges as a single line on one log scaled axes, w/ the ranges
+    # separated by a NaN so that they are not connected
+    nan_break = [np.nan]
+    xx = np.concatenate([xy for x_range in x for xy in (x_range, nan_break)][:-1])
+    yy = np.concatenate([xy for y_range in y for xy in (y_range, nan_break)][:-1])
 
-    # pylint: disable=consider-using-enumerate
-    fig, ax = plt.subplots(len(x), 1)
-    for plot in range(0, len(x)):
-        my_plotter(ax[plot], x[plot], y[plot], {'marker': 'x'})
+    fig, ax = plt.subplots(subplot_kw={'frameon': False})
+    ax.set_xscale('log')
+    ax.minorticks_off()
+    my_plotter(ax, xx, yy, {'marker': 'x'})
 
     fig.savefig('plot.png')
 
@@ -16,11 +16,9 @@ Copyright       (c) 2019 Michael Jay Lippert,
 """
 
 # Standard library imports
-from datetime import timedelta
-from typing import Sequence, Mapping, List, Any
+from typing import Sequence, Mapping
 
 # Third party imports
-import matplotlib.pyplot as plt
 import numpy as np
 
 # Local application imports
@@ -29,69 +27,83 @@ from riffdata.riffdata import Riffdata
 # Types
 MeetingId = str
 ParticipantId = str
-Utterance = Mapping[str, Any]
-Meeting = Mapping[MeetingId, Mapping[ParticipantId, Sequence[Utterance]]]
+UtteranceArrays = Mapping[str, np.ndarray]
+Meeting = Mapping[MeetingId, Mapping[ParticipantId, UtteranceArrays]]
 
 
-def get_utterance_gaps(meetings: Sequence[Meeting]) -> List[float]:
+def get_utterance_gaps(meetings: Sequence[Meeting]) -> np.ndarray:
     """
-    Compute and return a list of the gaps between participant's utterances
+    Compute and return an array of the gaps between participant's utterances
     in milliseconds.
 
-    :param meetings: Meetings w/ utterances grouped by participant to analyze
+    :param meetings: Meetings w/ the arrays of utterance start, end and duration
+                     grouped by participant to analyze
     :type meetings: dict
 
-    :return: list of the gaps in milliseconds between a participant's
+    :return: array of the gaps in milliseconds between a participant's
              utterances in a meeting
     """
-    gaps = []
-    processed_meeting_cnt = 0
-    speaking_participant_cnt = 0
+    # skip meetings with only 1 person
+    processed_meetings = [participant_uts for participant_uts in meetings.values()
+                          if len(participant_uts) >= 2]
+    all_uts = [uts for participant_uts in processed_meetings for uts in participant_uts.values()]
+
+    if len(all_uts) == 0:
+        gaps = np.empty(0, dtype=np.int64)
+        speaking_participant_cnt = 0
+    else:
+        # combine the utterances of all participants into single arrays, labeling each
+        # utterance w/ the index of its participant, and filter out uts w/ 0 duration
+        ut_participants = np.repeat(np.arange(len(all_uts)), [len(uts['start']) for uts in all_uts])
+        spoken = np.concatenate([uts['duration'] for uts in all_uts]) != 0
+        ut_participants = ut_participants[spoken]
+        starts = np.concatenate([uts['start'] for uts in all_uts])[spoken]
+        ends = np.concatenate([uts['end'] for uts in all_uts])[spoken]
+
+        # need at least 2 uts for there to be a gap
+        speaking_participant_cnt = np.count_nonzero(np.bincount(ut_participants) >= 2)
+
+        # sort the utterance start and end times by participant and then by start (stable
+        # so that the order of a participant's uts w/ the same start is kept)
+        order = np.lexsort((starts, ut_participants))
+        ut_participants = ut_participants[order]
+        starts = starts[order]
+        ends = ends[order]
+
+        # the gap between each utterance and the previous one by the same participant
+        same_participant = ut_participants[1:] == ut_participants[:-1]
+        gaps = (starts[1:] - ends[:-1])[same_participant]
+
+    print(f'processed {speaking_participant_cnt} participants in {len(processed_meetings)} meetings.'
+          f' {len(gaps)} gaps.')
 
-    for meeting_id in meetings:
-        participant_uts = meetings[meeting_id]
-
-        # skip meetings with only 1 person
-        if len(participant_uts) < 2:
-            continue
-
-        processed_meeting_cnt += 1
-
-        for participant_id in participant_uts:
-            uts = participant_uts[participant_id]
-
-            # filter out uts w/ 0 duration and then sort by start
-            uts = [ut for ut in uts if ut['duration'] != 0]
-            uts.sort(key=lambda ut: ut['start'])
-
-            # need at least 2 uts for there to be a gap
-            if len(uts) < 2:
-                continue
-
-            speaking_participant_cnt += 1
-
-            prev_ut = uts[0]
-            for cur_ut in uts[1:]:
-                gaps.append((cur_ut['start'] - prev_ut['end']) / timedelta(milliseconds=1))
-                prev_ut = cur_ut
-
-    print(f'processed {speaking_participant_cnt} participants in {processed_meeting_cnt} meetings. {len(gaps)} gaps.')
     return gaps
 
 
 def do_analysis():
+    # matplotlib is only needed to plot the results, so don't import it w/ this module
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
     riffdata = Riffdata()
-    meetings = riffdata.get_meetings_with_participant_utterances()
+    meetings = riffdata.get_meetings_with_participant_utterance_arrays()
 
     print(f'Found utterances from {len(meetings)} meetings')
 
     gaps = get_utterance_gaps(meetings)
 
-    x = np.array(gaps)
-    fig, ax = plt.subplots()
+    x = np.asarray(gaps, dtype=np.float64)
+    fig, ax = plt.subplots(subplot_kw={'frameon': False})
+    ax.minorticks_off()
     # the histogram of the data (see example: https://matplotlib.org/gallery/statistics/histogram_features.html)
+    # the bins are all the same width, so the bin of a gap can be calculated instead
+    # of searched for as ax.hist (np.histogram) does
     num_bins = 50
-    ax.hist(x, num_bins, range=(0, 4000))
+    hist_max = 4000
+    bin_width = hist_max / num_bins
+    x = x[(x >= 0) & (x <= hist_max)]
+    bins = np.minimum((x / bin_width).astype(np.int64), num_bins - 1)  # hist_max is in the last bin
+    counts = np.bincount(bins, minlength=num_bins)
+    ax.bar(np.arange(num_bins) * bin_width, counts, width=bin_width, align='edge')
 
     fig.savefig('plot_gap.png')
 
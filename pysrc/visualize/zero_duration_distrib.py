@@ -17,59 +17,70 @@ Copyright       (c) 2019-present Riff Learning Inc.,
 """
 
 # Standard library imports
-from datetime import timedelta
-from functools import reduce
-from typing import List
 
 # Third party imports
-import matplotlib.pyplot as plt
 import numpy as np
 
 # Local application imports
 from riffdata.riffdata import Riffdata
 
+MS_PER_MINUTE = 60 * 1000
 
-def get_zerolen_ut_distribution(meetings) -> List[int]:
+
+def get_zerolen_ut_distribution(meetings) -> np.ndarray:
     """
     Distribute the utterances of a meeting into buckets representing the percentile
     of the meeting duration, summing the percentiles over all meetings.
 
-    :param meetings: map of meeting ids to a map of participant ids to the list
-                     of utterances by that participant in that meeting
+    :param meetings: map of meeting ids to a map of participant ids to the arrays
+                     of the start, end and duration of the utterances by that
+                     participant in that meeting
 
-    :return: list of counts of the zero length utterances in a percentile
+    :return: array of counts of the zero length utterances in a percentile
              of the meeting duration.
     """
     num_buckets = 50
-    distributions = [0 for i in range(0, num_buckets)]
-
-    def distribute(distributions, bucket):
-        distributions[bucket] += 1
-        return distributions
-
-    for meeting_id in meetings:
-        participant_uts = meetings[meeting_id]
-        # combine all the utterances from the meeting into a single list
-        all_meeting_uts = [ut for p_id in participant_uts for ut in participant_uts[p_id]]
-        if len(all_meeting_uts) == 0:
-            continue
-
-        # use the utterances to determine the meeting start and end
-        meeting_start = min(all_meeting_uts, key=lambda ut: ut['start'])['start']
-        meeting_end = max(all_meeting_uts, key=lambda ut: ut['end'])['end']
-        meeting_duration = meeting_end - meeting_start
-        if meeting_duration < timedelta(minutes=1):
-            continue
-
-        # increase the bucket_size by 1ms to avoid the issue if the last utterance is
-        # a 0 length utterance. This should not have any real affect on the results.
-        bucket_size = (meeting_end - meeting_start) / num_buckets + timedelta(milliseconds=1)
-
-        # create a list of the bucket for each utterance of len 0 and then sum those into
-        # the distributions list of bucket counts
-        reduce(distribute, [(ut['start'] - meeting_start) // bucket_size
-                            for ut in all_meeting_uts if ut['duration'] == 0],
-               distributions)
+
+    # combine the utterance starts, ends and durations from all participants of all meetings
+    # into single arrays, where the utterances of each meeting are contiguous
+    all_uts = [uts for participant_uts in meetings.values() for uts in participant_uts.values()]
+    if len(all_uts) == 0:
+        return np.zeros(num_buckets, dtype=np.int64)
+
+    ut_starts = np.concatenate([uts['start'] for uts in all_uts])
+    ut_ends = np.concatenate([uts['end'] for uts in all_uts])
+    ut_durations = np.concatenate([uts['duration'] for uts in all_uts])
+
+    # the number of utterances in each meeting (w/ any utterances) and the index of each
+    # meeting's first utterance in the utterance arrays
+    meeting_ut_cnts = np.array([sum(len(uts['start']) for uts in participant_uts.values())
+                                for participant_uts in meetings.values()], dtype=np.int64)
+    meeting_ut_cnts = meeting_ut_cnts[meeting_ut_cnts > 0]
+    meeting_offsets = np.cumsum(meeting_ut_cnts) - meeting_ut_cnts
+
+    # use the utterances to determine the meeting start and end
+    meeting_starts = np.minimum.reduceat(ut_starts, meeting_offsets)
+    meeting_ends = np.maximum.reduceat(ut_ends, meeting_offsets)
+    meeting_durations = meeting_ends - meeting_starts
+
+    # increase the bucket_size by 1ms to avoid the issue if the last utterance is
+    # a 0 length utterance. This should not have any real affect on the results.
+    # bucket_size = meeting_duration / num_buckets + 1ms, so that the bucket of an
+    # utterance, offset // bucket_size, can be computed w/ only integer operations as
+    # offset * num_buckets // (meeting_duration + num_buckets)
+    bucket_sizes_scaled = meeting_durations + num_buckets
+
+    # skip the meetings shorter than a minute up front, only the utterances of len 0 in
+    # the remaining meetings need to know their meeting
+    long_meetings = meeting_durations >= MS_PER_MINUTE
+    zerolen_uts = np.flatnonzero((ut_durations == 0) & np.repeat(long_meetings, meeting_ut_cnts))
+    zerolen_ut_meetings = np.searchsorted(meeting_offsets, zerolen_uts, side='right') - 1
+
+    # find the bucket for each of those utterances from its offset from the meeting start
+    # and then count the utterances in each bucket
+    buckets = ((ut_starts[zerolen_uts] - meeting_starts[zerolen_ut_meetings]) * num_buckets
+               // bucket_sizes_scaled[zerolen_ut_meetings])
+    distributions = np.bincount(buckets, minlength=num_buckets)
 
     return distributions
 
@@ -102,8 +113,11 @@ def my_plotter(ax, data1, data2, param_dict):
 
 
 def do_analysis():
+    # matplotlib is only needed to plot the results, so don't import it w/ this module
+    import matplotlib.pyplot as plt  # pylint: disable=import-outside-toplevel
+
     riffdata = Riffdata()
-    meetings = riffdata.get_meetings_with_participant_utterances()
+    meetings = riffdata.get_meetings_with_participant_utterance_arrays()
 
     print(f'Found utterances from {len(meetings)} meetings')
 
@@ -114,7 +128,8 @@ def do_analysis():
     y = np.array(zerolen_ut_distribution)
 
     # pylint: disable=consider-using-enumerate
-    fig, ax = plt.subplots()
+    fig, ax = plt.subplots(subplot_kw={'frameon': False})
+    ax.minorticks_off()
     my_plotter(ax, x, y, {'marker': 'x'})
 
     fig.savefig('plot_0_distrib.png')